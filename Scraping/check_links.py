@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import requests
+
+# --- CONFIGURACIÓN ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Carpeta actual (Scraping)
+PATH_PROJECTS = os.path.join(BASE_DIR, "Projects")
+PATH_STRATEGIES = os.path.join(BASE_DIR, "Strategies")
+
+CACHE_FILE = os.getenv("LINK_CHECK_CACHE", os.path.join(BASE_DIR, "link_cache.json"))
+REPORT_FILE = os.getenv("LINK_CHECK_REPORT", os.path.join(BASE_DIR, "link_report.json"))
+
+TTL_HOURS = float(os.getenv("LINK_CHECK_TTL_HOURS", "168"))  # enlaces OK: 7 días
+FAILED_TTL_HOURS = float(os.getenv("LINK_CHECK_FAILED_TTL_HOURS", "1"))  # enlaces rotos: se reintentan pronto
+MAX_CONCURRENCY = int(os.getenv("LINK_CHECK_CONCURRENCY", "16"))
+MAX_PER_HOST = int(os.getenv("LINK_CHECK_PER_HOST", "4"))
+TIMEOUT = float(os.getenv("LINK_CHECK_TIMEOUT", "15"))
+
+HEADERS = {"User-Agent": "Mozilla/5.0..."}
+# Servidores que no aceptan HEAD (o lo rechazan a bots): se reintenta con GET de 1 byte.
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 429, 500, 501, 503}
+# Sólo estos códigos indican que el recurso ya no existe; el resto de fallos
+# (red, timeouts, 429, 5xx, bloqueos a bots) se consideran transitorios.
+DEFINITIVE_STATUSES = {404, 410}
+
+# Campos con URLs externas en los JSON del catálogo.
+PROJECT_FIELDS = ["thumbnail", "external_link", "location_map", "logo_url"]
+PROJECT_LIST_FIELDS = ["gallery_images"]
+PROJECT_TRANSLATION_FIELDS = ["video_url"]
+STRATEGY_FIELDS = ["logo_url", "hero_image", "hero_image_url"]
+
+
+def load_json(path, filename):
+    full_path = os.path.join(path, filename)
+    if os.path.exists(full_path):
+        with open(full_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    print(f"⚠️ Advertencia: No se encontró el archivo {full_path}")
+    return []
+
+
+def is_checkable(url) -> bool:
+    return isinstance(url, str) and urlsplit(url.strip()).scheme in ("http", "https")
+
+
+def collect_urls(projects, strategies):
+    """Devuelve {url: [usos]} deduplicando URLs repetidas entre registros e idiomas."""
+    usages = {}
+
+    def add(url, kind, slug, field):
+        if not is_checkable(url):
+            return
+        usages.setdefault(url.strip(), []).append({"kind": kind, "slug": slug, "field": field})
+
+    for p in projects:
+        slug = p.get("slug")
+        for field in PROJECT_FIELDS:
+            add(p.get(field), "project", slug, field)
+        for field in PROJECT_LIST_FIELDS:
+            for url in p.get(field) or []:
+                add(url, "project", slug, field)
+        for lang, t in (p.get("translations") or {}).items():
+            for field in PROJECT_TRANSLATION_FIELDS:
+                add((t or {}).get(field), "project", slug, f"translations.{lang}.{field}")
+
+    for s in strategies:
+        slug = s.get("slug")
+        for field in STRATEGY_FIELDS:
+            add(s.get(field), "strategy", slug, field)
+
+    return usages
+
+
+def load_cache(path=CACHE_FILE) -> dict:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print(f"⚠️ Advertencia: caché ilegible, se ignora: {path}")
+        return {}
+
+
+def write_json_atomic(data, path):
+    # tmp + os.replace: quien lea el archivo nunca ve un JSON a medias.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def save_cache(cache: dict, path=CACHE_FILE):
+    write_json_atomic(cache, path)
+
+
+def is_fresh(entry, now: float) -> bool:
+    if not entry or "checked_at" not in entry:
+        return False
+    ttl_hours = TTL_HOURS if entry.get("ok") else FAILED_TTL_HOURS
+    return now - entry["checked_at"] < ttl_hours * 3600
+
+
+def prune_cache(cache: dict, urls) -> int:
+    """Elimina de la caché las URLs que ya no aparecen en el catálogo."""
+    stale = set(cache) - set(urls)
+    for url in stale:
+        del cache[url]
+    return len(stale)
+
+
+def classify_failure(entry) -> str:
+    return "definitive" if entry.get("status") in DEFINITIVE_STATUSES else "transient"
+
+
+def check_url(url: str, timeout: float = TIMEOUT) -> dict:
+    """HEAD y, si el servidor no lo soporta, GET acotado a 1 byte. Bloqueante."""
+    result = {"ok": False, "status": None, "final_url": None, "error": None, "method": "HEAD"}
+    try:
+        res = requests.head(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+        if res.status_code in HEAD_FALLBACK_STATUSES:
+            result["method"] = "GET"
+            headers = dict(HEADERS, Range="bytes=0-0")
+            with requests.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True) as get_res:
+                res = get_res
+        result["status"] = res.status_code
+        result["final_url"] = res.url
+        result["ok"] = res.status_code < 400
+    except requests.RequestException as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+async def check_urls(urls, cache: dict, now: float = None, checker=check_url):
+    """Revisa en paralelo las URLs caducadas, limitando concurrencia global y por host."""
+    now = time.time() if now is None else now
+    stale = [u for u in urls if not is_fresh(cache.get(u), now)]
+
+    loop = asyncio.get_running_loop()
+    global_limit = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_limits = {}
+
+    async def run(url, executor):
+        host = urlsplit(url).netloc.lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(MAX_PER_HOST))
+        async with host_limit, global_limit:
+            try:
+                result = await loop.run_in_executor(executor, checker, url)
+            except Exception as e:
+                # Un fallo inesperado en una URL no debe perder los resultados del resto.
+                result = {"ok": False, "status": None, "final_url": None, "error": f"{type(e).__name__}: {e}"}
+        result["checked_at"] = time.time()
+        cache[url] = result
+        mark = "✅" if result["ok"] else "❌"
+        print(f"{mark} {result['status'] or result['error']} {url}")
+
+    # Pool propio: el del loop por defecto limita los hilos a min(32, CPUs + 4).
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        await asyncio.gather(*(run(u, executor) for u in stale))
+    return len(stale)
+
+
+def build_report(usages: dict, cache: dict) -> dict:
+    broken = []
+    for url in sorted(usages):
+        entry = cache.get(url) or {}
+        if not entry.get("ok"):
+            broken.append(
+                {
+                    "url": url,
+                    "failure": classify_failure(entry),
+                    "status": entry.get("status"),
+                    "error": entry.get("error"),
+                    "checked_at": entry.get("checked_at"),
+                    "used_by": usages[url],
+                }
+            )
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "total_urls": len(usages),
+        "broken_count": len(broken),
+        "definitive_count": sum(1 for b in broken if b["failure"] == "definitive"),
+        "broken": broken,
+    }
+
+
+def run_check():
+    print("🔎 Revisando enlaces y recursos del catálogo...")
+    projects = load_json(PATH_PROJECTS, "projects_base.json")
+    strategies = load_json(PATH_STRATEGIES, "strategies_base.json")
+    usages = collect_urls(projects, strategies)
+
+    cache = load_cache()
+    pruned = prune_cache(cache, usages)
+    try:
+        checked = asyncio.run(check_urls(list(usages), cache))
+    finally:
+        # Guardar lo revisado aunque la corrida se interrumpa (Ctrl-C, error inesperado).
+        save_cache(cache)
+
+    report = build_report(usages, cache)
+    write_json_atomic(report, REPORT_FILE)
+
+    print(
+        f"\n✨ {len(usages)} URLs únicas, {checked} revisadas ({len(usages) - checked} desde caché), "
+        f"{report['broken_count']} rotas ({report['definitive_count']} definitivas), "
+        f"{pruned} eliminadas de la caché. Reporte: {REPORT_FILE}"
+    )
+
+
+if __name__ == "__main__":
+    run_check()
@@ -0,0 +1,102 @@
+import asyncio
+import functools
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import check_links  # noqa: E402
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Servidor local que imita los casos reales: HEAD rechazado, 404, 410 y 503."""
+
+    def do_HEAD(self):
+        statuses = {"/ok": 200, "/no-head": 405, "/gone": 410, "/busy": 503}
+        self.send_response(statuses.get(self.path, 404))
+        self.end_headers()
+
+    def do_GET(self):
+        statuses = {"/ok": 206, "/no-head": 206, "/gone": 410, "/busy": 503}
+        self.send_response(statuses.get(self.path, 404))
+        self.end_headers()
+        self.wfile.write(b"x")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_urls_against_stand_in_server(server_url):
+    projects = [
+        {
+            "slug": "demo",
+            "thumbnail": f"{server_url}/ok",
+            "gallery_images": [f"{server_url}/ok", f"{server_url}/missing", f"{server_url}/gone"],
+            "translations": {
+                "en": {"video_url": f"{server_url}/no-head"},
+                "es": {"video_url": f"{server_url}/no-head"},
+            },
+        }
+    ]
+    strategies = [{"slug": "s", "logo_url": f"{server_url}/busy", "hero_image": "http://127.0.0.1:1/refused"}]
+    usages = check_links.collect_urls(projects, strategies)
+    assert len(usages) == 6  # /ok y /no-head se deduplican
+
+    checker = functools.partial(check_links.check_url, timeout=2)
+    cache = {}
+    assert asyncio.run(check_links.check_urls(list(usages), cache, checker=checker)) == 6
+
+    assert cache[f"{server_url}/ok"]["ok"] and cache[f"{server_url}/ok"]["method"] == "HEAD"
+    assert cache[f"{server_url}/no-head"]["ok"] and cache[f"{server_url}/no-head"]["method"] == "GET"
+    assert cache[f"{server_url}/no-head"]["status"] == 206
+    assert cache[f"{server_url}/missing"]["status"] == 404
+    assert cache["http://127.0.0.1:1/refused"]["error"].startswith("ConnectionError")
+
+    report = check_links.build_report(usages, cache)
+    failures = {b["url"]: b["failure"] for b in report["broken"]}
+    assert failures == {
+        f"{server_url}/missing": "definitive",
+        f"{server_url}/gone": "definitive",
+        f"{server_url}/busy": "transient",
+        "http://127.0.0.1:1/refused": "transient",
+    }
+    assert report["definitive_count"] == 2
+
+    # Segunda corrida: los OK siguen frescos en caché; sólo se reintentan los fallidos tras su TTL.
+    later = max(e["checked_at"] for e in cache.values()) + check_links.FAILED_TTL_HOURS * 3600 + 1
+    assert asyncio.run(check_links.check_urls(list(usages), cache, now=later, checker=checker)) == 4
+
+
+def test_checker_exceptions_do_not_lose_results():
+    def checker(url):
+        if url.endswith("/boom"):
+            raise RuntimeError("boom")
+        return {"ok": True, "status": 200, "final_url": url, "error": None, "method": "HEAD"}
+
+    cache = {}
+    urls = ["http://a.test/ok", "http://a.test/boom"]
+    asyncio.run(check_links.check_urls(urls, cache, checker=checker))
+
+    assert cache["http://a.test/ok"]["ok"]
+    assert cache["http://a.test/boom"]["error"] == "RuntimeError: boom"
+    assert check_links.classify_failure(cache["http://a.test/boom"]) == "transient"
+
+
+def test_prune_cache_drops_urls_missing_from_catalog():
+    cache = {"http://a.test/keep": {"ok": True}, "http://a.test/old": {"ok": False}}
+    assert check_links.prune_cache(cache, {"http://a.test/keep": []}) == 1
+    assert list(cache) == ["http://a.test/keep"]
@@ -0,0 +1,388 @@
+import hashlib
+import json
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Carpeta actual (Supabase)
+IDIOMAS = ["es", "en", "zh"]
+
+# --- CONFIGURACIÓN DE SNAPSHOTS ---
+# Documentos JSON listos para renderizar, uno por proyecto e idioma, más un
+# listado compacto por idioma para el grid de /projects.
+SNAPSHOT_TARGET = os.getenv("SNAPSHOT_TARGET", "local").strip().lower()  # local | storage
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR") or os.path.join(BASE_DIR, "snapshots")
+SNAPSHOT_BUCKET = os.getenv("SNAPSHOT_BUCKET", "portal-assets")
+SNAPSHOT_PREFIX = os.getenv("SNAPSHOT_PREFIX", "snapshots").strip("/")
+SNAPSHOT_CACHE_CONTROL = os.getenv("SNAPSHOT_CACHE_CONTROL", "300")  # segundos; storage3 antepone "max-age="
+
+MANIFEST_NAME = "manifest.json"
+# Subir al cambiar el formato de los documentos: un manifest de otra versión se
+# descarta y todos los snapshots se regeneran.
+MANIFEST_VERSION = 2
+PAGE_SIZE = 1000
+
+
+def canonical_json(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(value) -> str:
+    return hashlib.sha256(canonical_json(value)).hexdigest()
+
+
+def project_path(lang: str, slug: str) -> str:
+    return f"projects/{lang}/{slug}.json"
+
+
+def list_path(lang: str) -> str:
+    return f"projects/{lang}/index.json"
+
+
+def get_client():
+    # Import diferido: upload_to_supabase crea el cliente (y sale si faltan credenciales)
+    # al importarse, y las funciones puras de este módulo no lo necesitan.
+    from upload_to_supabase import supabase
+
+    return supabase
+
+
+def fetch_all(query_fn):
+    # PostgREST limita las respuestas; paginamos con range() para no truncar.
+    # query_fn debe ordenar por una clave única, o las páginas pueden saltar o repetir filas.
+    rows = []
+    start = 0
+    while True:
+        res = query_fn().range(start, start + PAGE_SIZE - 1).execute()
+        batch = res.data or []
+        rows.extend(batch)
+        if len(batch) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+
+def fetch_sources():
+    supabase = get_client()
+    projects = fetch_all(
+        lambda: supabase.table("projects")
+        .select(
+            "id, slug, thumbnail_url, external_link_url, location_map_url, gallery_urls, "
+            "published_at, translations"
+        )
+        .eq("status", "published")
+        .is_("deleted_at", "null")
+        .order("slug")
+    )
+    paragraphs = fetch_all(
+        lambda: supabase.table("project_paragraphs")
+        .select("id, project_id, paragraph_key, sort_order, translations")
+        .is_("deleted_at", "null")
+        .order("sort_order")
+        .order("id")
+    )
+    links = fetch_all(
+        lambda: supabase.table("paragraph_strategies").select("paragraph_id, strategy_id")
+        .order("paragraph_id")
+        .order("strategy_id")
+    )
+    strategies = fetch_all(
+        lambda: supabase.table("strategies")
+        .select("id, slug, logo_url, translations")
+        .eq("status", "published")
+        .is_("deleted_at", "null")
+        .order("slug")
+    )
+    return projects, paragraphs, links, strategies
+
+
+def group_sources(projects, paragraphs, links, strategies):
+    """Agrupa las filas por proyecto: {slug: {"project", "paragraphs", "strategies"}}."""
+    strategies_by_id = {s["id"]: s for s in strategies}
+
+    strategy_ids_by_paragraph = {}
+    for link in links:
+        if link["strategy_id"] in strategies_by_id:
+            strategy_ids_by_paragraph.setdefault(link["paragraph_id"], []).append(link["strategy_id"])
+
+    paragraphs_by_project = {}
+    for para in paragraphs:
+        paragraphs_by_project.setdefault(para["project_id"], []).append(para)
+
+    grouped = {}
+    for project in projects:
+        project_paragraphs = sorted(
+            paragraphs_by_project.get(project["id"], []),
+            key=lambda p: (p.get("sort_order") or 0, p["paragraph_key"]),
+        )
+        entries = []
+        linked = {}
+        for para in project_paragraphs:
+            ids = sorted(set(strategy_ids_by_paragraph.get(para["id"], [])))
+            entries.append({"paragraph": para, "strategy_ids": ids})
+            for sid in ids:
+                linked[sid] = strategies_by_id[sid]
+        grouped[project["slug"]] = {
+            "project": project,
+            "paragraphs": entries,
+            "strategies": [linked[sid] for sid in sorted(linked)],
+        }
+    return grouped
+
+
+def pick_translation(translations, lang: str) -> dict:
+    # Igual que el portal para los campos del proyecto: objeto del idioma pedido o, si falta, inglés.
+    translations = translations or {}
+    return translations.get(lang) or translations.get("en") or {}
+
+
+def pick_field(translations, lang: str, field: str):
+    # Igual que el portal para párrafos y estrategias: el fallback a inglés es por campo.
+    translations = translations or {}
+    return (translations.get(lang) or {}).get(field) or (translations.get("en") or {}).get(field)
+
+
+def strategy_summary(strategy, lang: str) -> dict:
+    return {
+        "slug": strategy["slug"],
+        "title": pick_field(strategy.get("translations"), lang, "title") or strategy["slug"],
+        "logo_url": strategy.get("logo_url"),
+    }
+
+
+def build_project_document(source, lang: str) -> dict:
+    project = source["project"]
+    t = pick_translation(project.get("translations"), lang)
+    en = (project.get("translations") or {}).get("en") or {}
+    strategies_by_id = {s["id"]: s for s in source["strategies"]}
+
+    paragraphs = []
+    for entry in source["paragraphs"]:
+        para = entry["paragraph"]
+        paragraphs.append(
+            {
+                "key": para["paragraph_key"],
+                "sort_order": para.get("sort_order") or 0,
+                "body_html": pick_field(para.get("translations"), lang, "body_html") or "",
+                "strategies": [strategy_summary(strategies_by_id[sid], lang) for sid in entry["strategy_ids"]],
+            }
+        )
+
+    strategies = sorted(
+        (strategy_summary(s, lang) for s in source["strategies"]),
+        key=lambda s: (s["title"], s["slug"]),
+    )
+
+    return {
+        "slug": project["slug"],
+        "lang": lang,
+        "title": t.get("title") or project["slug"],
+        "short_description": t.get("short_description") or "",
+        "introduction": t.get("introduction") or "",
+        "video_url": t.get("video_url") or en.get("video_url") or "",
+        "thumbnail_url": project.get("thumbnail_url"),
+        "external_link": {"url": project.get("external_link_url"), "text": t.get("external_link_text") or ""},
+        "location_map": {"url": project.get("location_map_url"), "text": t.get("location_map_text") or ""},
+        "gallery_urls": [u for u in (project.get("gallery_urls") or []) if u],
+        "published_at": project.get("published_at"),
+        "paragraphs": paragraphs,
+        "strategies": strategies,
+    }
+
+
+def sort_for_grid(sources):
+    # Orden del grid del portal: published_at desc (nulos al final) y desempate por id.
+    # Se omite updated_at: la migración lo cambia en cada corrida y reordenaría el
+    # listado sin cambios reales de contenido.
+    ordered = sorted(sources, key=lambda src: src["project"]["id"])
+    ordered.sort(key=lambda src: src["project"].get("published_at") or "", reverse=True)
+    ordered.sort(key=lambda src: not src["project"].get("published_at"))
+    return ordered
+
+
+def build_list_document(grouped, lang: str) -> dict:
+    items = []
+    for source in sort_for_grid(grouped.values()):
+        project = source["project"]
+        slug = project["slug"]
+        t = pick_translation(project.get("translations"), lang)
+        items.append(
+            {
+                "slug": slug,
+                "title": t.get("title") or slug,
+                "short_description": t.get("short_description") or "",
+                "thumbnail_url": project.get("thumbnail_url"),
+                "published_at": project.get("published_at"),
+                "strategies": [s["slug"] for s in source["strategies"]],
+            }
+        )
+    return {"lang": lang, "projects": items}
+
+
+class LocalSnapshotStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    def read(self, path: str):
+        full_path = os.path.join(self.root, path)
+        if not os.path.exists(full_path):
+            return None
+        with open(full_path, "rb") as f:
+            return f.read()
+
+    def write(self, path: str, data: bytes):
+        full_path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Escritura atómica: el portal nunca ve un JSON a medias.
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, full_path)
+
+    def delete(self, paths):
+        for path in paths:
+            full_path = os.path.join(self.root, path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+
+    def list_paths(self, folder: str) -> set:
+        full_folder = os.path.join(self.root, folder)
+        if not os.path.isdir(full_folder):
+            return set()
+        return {f"{folder}/{name}" for name in os.listdir(full_folder) if name.endswith(".json")}
+
+
+class StorageSnapshotStore:
+    def __init__(self, bucket: str, prefix: str):
+        self.bucket = get_client().storage.from_(bucket)
+        self.prefix = prefix
+
+    def _key(self, path: str) -> str:
+        return f"{self.prefix}/{path}" if self.prefix else path
+
+    def read(self, path: str):
+        from storage3.utils import StorageException
+
+        try:
+            return self.bucket.download(self._key(path))
+        except StorageException as e:
+            # Sólo "no existe" equivale a un manifest vacío; cualquier otro error se propaga
+            # para no reescribir todo ni saltarse la limpieza de snapshots obsoletos.
+            details = e.args[0] if e.args and isinstance(e.args[0], dict) else {}
+            if str(details.get("statusCode")) in ("400", "404") and details.get("error") in ("not_found", "Not found"):
+                return None
+            raise
+
+    def write(self, path: str, data: bytes):
+        self.bucket.upload(
+            self._key(path),
+            data,
+            {
+                "content-type": "application/json; charset=utf-8",
+                "cache-control": SNAPSHOT_CACHE_CONTROL,
+                "x-upsert": "true",
+            },
+        )
+
+    def delete(self, paths):
+        if paths:
+            self.bucket.remove([self._key(p) for p in paths])
+
+    def list_paths(self, folder: str) -> set:
+        paths = set()
+        offset = 0
+        while True:
+            batch = self.bucket.list(self._key(folder), {"limit": PAGE_SIZE, "offset": offset}) or []
+            paths.update(f"{folder}/{item['name']}" for item in batch if item["name"].endswith(".json"))
+            if len(batch) < PAGE_SIZE:
+                return paths
+            offset += PAGE_SIZE
+
+
+def get_store():
+    if SNAPSHOT_TARGET == "storage":
+        return StorageSnapshotStore(SNAPSHOT_BUCKET, SNAPSHOT_PREFIX)
+    return LocalSnapshotStore(SNAPSHOT_DIR)
+
+
+def load_manifest(store) -> dict:
+    raw = store.read(MANIFEST_NAME)
+    if raw:
+        try:
+            manifest = json.loads(raw)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except ValueError:
+            pass
+    return {"version": MANIFEST_VERSION, "projects": {}, "lists": {}}
+
+
+def write_snapshots(grouped, store, manifest: dict) -> dict:
+    """Escribe sólo los documentos que cambiaron (o faltan) y guarda el nuevo manifest."""
+    stats = {"written": 0, "skipped": 0, "deleted": 0}
+    previous_projects = manifest.get("projects", {})
+    previous_lists = manifest.get("lists", {})
+    new_manifest = {"version": MANIFEST_VERSION, "projects": {}, "lists": {}}
+    # Un archivo borrado o perdido se reescribe aunque el manifest diga que está al día.
+    existing = set().union(*(store.list_paths(f"projects/{lang}") for lang in IDIOMAS))
+
+    def write_if_changed(path, doc, previous_hash):
+        doc_hash = content_hash(doc)
+        if previous_hash != doc_hash or path not in existing:
+            store.write(path, canonical_json(doc))
+            stats["written"] += 1
+        else:
+            stats["skipped"] += 1
+        return {"path": path, "hash": doc_hash}
+
+    for slug, source in grouped.items():
+        previous_files = previous_projects.get(slug, {}).get("files", {})
+        written_before = stats["written"]
+        files = {
+            lang: write_if_changed(
+                project_path(lang, slug),
+                build_project_document(source, lang),
+                previous_files.get(lang, {}).get("hash"),
+            )
+            for lang in IDIOMAS
+        }
+        new_manifest["projects"][slug] = {"files": files}
+        if stats["written"] > written_before:
+            print(f"✅ Snapshot generado: {slug}")
+
+    stale_paths = [
+        entry["path"]
+        for slug, previous in previous_projects.items()
+        if slug not in grouped
+        for entry in previous.get("files", {}).values()
+    ]
+    if stale_paths:
+        store.delete(stale_paths)
+        stats["deleted"] = len(stale_paths)
+        print(f"🗑️  Snapshots eliminados (proyectos no publicados): {len(stale_paths)}")
+
+    for lang in IDIOMAS:
+        new_manifest["lists"][lang] = write_if_changed(
+            list_path(lang),
+            build_list_document(grouped, lang),
+            previous_lists.get(lang, {}).get("hash"),
+        )
+
+    store.write(MANIFEST_NAME, json.dumps(new_manifest, ensure_ascii=False, sort_keys=True, indent=2).encode("utf-8"))
+    return stats
+
+
+def build_snapshots():
+    print("\n📦 Generando snapshots de páginas...")
+    store = get_store()
+    manifest = load_manifest(store)
+
+    grouped = group_sources(*fetch_sources())
+    stats = write_snapshots(grouped, store, manifest)
+
+    destino = f"{SNAPSHOT_BUCKET}/{SNAPSHOT_PREFIX}" if SNAPSHOT_TARGET == "storage" else SNAPSHOT_DIR
+    print(
+        f"✨ Snapshots listos en {destino}: {stats['written']} escritos, "
+        f"{stats['skipped']} sin cambios, {stats['deleted']} eliminados."
+    )
+
+
+if __name__ == "__main__":
+    build_snapshots()
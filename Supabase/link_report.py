@@ -0,0 +1,51 @@
+import json
+import os
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+# Reporte de Scraping/check_links.py. Las URLs rotas se "marcan" con una advertencia
+# en el log de la migración y, opcionalmente, se descartan si el fallo es definitivo.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Carpeta actual (Supabase)
+
+load_dotenv()
+
+LINK_REPORT = os.getenv("MIGRATION_LINK_REPORT") or os.path.join(BASE_DIR, "..", "Scraping", "link_report.json")
+DROP_BROKEN_ASSETS = os.getenv("MIGRATION_DROP_BROKEN_ASSETS", "").strip().lower() in ("1", "true", "yes")
+LINK_REPORT_MAX_AGE_HOURS = float(os.getenv("MIGRATION_LINK_REPORT_MAX_AGE_HOURS", "168"))
+
+
+def load_broken_urls(path=LINK_REPORT, max_age_hours=LINK_REPORT_MAX_AGE_HOURS, now=None) -> dict:
+    """Devuelve {url: "definitive" | "transient"} a partir del reporte de check_links.py."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        broken = {b["url"]: b.get("failure", "transient") for b in report.get("broken", [])}
+        generated_at = datetime.fromisoformat(report["generated_at"])
+        age_hours = ((now or datetime.now(timezone.utc)) - generated_at).total_seconds() / 3600
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # El reporte es opcional: uno truncado o inválido no debe detener la migración.
+        print(f"⚠️ Advertencia: reporte de enlaces ilegible, se ignora: {path}")
+        return {}
+
+    if age_hours > max_age_hours:
+        # Un reporte viejo puede incluir recursos que ya se recuperaron: sólo se marcan.
+        print(f"⚠️ Reporte de enlaces con {age_hours:.0f} h de antigüedad; no se descartará ninguna URL.")
+        broken = {url: "transient" for url in broken}
+
+    definitive = sum(1 for failure in broken.values() if failure == "definitive")
+    print(f"ℹ️  Reporte de enlaces: {len(broken)} URLs rotas, {definitive} definitivas ({path})")
+    return broken
+
+
+def asset_url(url, broken: dict, slug: str, field: str, drop_broken=DROP_BROKEN_ASSETS):
+    """Marca la URL si está rota; sólo la descarta si el fallo es definitivo y drop_broken está activo."""
+    if not url or url.strip() not in broken:
+        return url
+    failure = broken[url.strip()]
+    drop = drop_broken and failure == "definitive"
+    action = "descartada" if drop else "conservada"
+    print(f"⚠️ URL rota ({failure}) en {slug}.{field} ({action}): {url}")
+    return None if drop else url
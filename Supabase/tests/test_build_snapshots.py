@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import build_snapshots  # noqa: E402
+
+
+def make_rows(published=("a", "b", "c")):
+    projects = [
+        {"id": "id-a", "slug": "a", "published_at": "2024-01-01", "translations": {"en": {"title": "A"}}},
+        {"id": "id-b", "slug": "b", "published_at": None, "translations": {"en": {"title": "B"}}},
+        {"id": "id-c", "slug": "c", "published_at": "2025-06-01", "translations": {"en": {"title": "C"}}},
+    ]
+    paragraphs = [
+        {
+            "id": "p1",
+            "project_id": "id-a",
+            "paragraph_key": "a-p1",
+            "sort_order": 1,
+            "translations": {"en": {"body_html": "<p>EN</p>"}, "zh": {"body_html": ""}},
+        }
+    ]
+    links = [{"paragraph_id": "p1", "strategy_id": "s1"}]
+    strategies = [{"id": "s1", "slug": "s1", "logo_url": None, "translations": {"en": {"title": "Strategy"}, "zh": {}}}]
+    projects = [p for p in projects if p["slug"] in published]
+    return projects, paragraphs, links, strategies
+
+
+@pytest.fixture
+def store(tmp_path):
+    return build_snapshots.LocalSnapshotStore(str(tmp_path))
+
+
+def run(store, rows):
+    grouped = build_snapshots.group_sources(*rows)
+    return build_snapshots.write_snapshots(grouped, store, build_snapshots.load_manifest(store))
+
+
+def test_unchanged_sources_skip_writes(store):
+    first = run(store, make_rows())
+    assert first["written"] == 3 * 3 + 3  # 3 proyectos x 3 idiomas + 3 listados
+
+    second = run(store, make_rows())
+    assert second["written"] == 0
+    assert second["skipped"] == first["written"]
+
+
+def test_missing_file_is_rewritten(store, tmp_path):
+    run(store, make_rows())
+    os.remove(tmp_path / "projects" / "es" / "a.json")
+
+    stats = run(store, make_rows())
+    assert stats["written"] == 1
+    assert (tmp_path / "projects" / "es" / "a.json").exists()
+
+
+def test_old_manifest_version_forces_rewrite(store, tmp_path):
+    run(store, make_rows())
+    manifest_path = tmp_path / build_snapshots.MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["version"] = build_snapshots.MANIFEST_VERSION - 1
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    assert run(store, make_rows())["written"] == 12
+
+
+def test_unpublished_project_files_are_deleted(store, tmp_path):
+    run(store, make_rows())
+    stats = run(store, make_rows(published=("a", "c")))
+
+    assert stats["deleted"] == 3
+    for lang in build_snapshots.IDIOMAS:
+        assert not (tmp_path / "projects" / lang / "b.json").exists()
+    index = json.loads((tmp_path / "projects" / "en" / "index.json").read_text(encoding="utf-8"))
+    assert [item["slug"] for item in index["projects"]] == ["c", "a"]
+
+
+def test_grid_orders_by_published_at_desc_with_nulls_last():
+    grouped = build_snapshots.group_sources(*make_rows())
+    doc = build_snapshots.build_list_document(grouped, "es")
+    assert [item["slug"] for item in doc["projects"]] == ["c", "a", "b"]
+
+
+def test_paragraph_and_strategy_fall_back_to_english_per_field():
+    grouped = build_snapshots.group_sources(*make_rows())
+    doc = build_snapshots.build_project_document(grouped["a"], "zh")
+
+    assert doc["paragraphs"][0]["body_html"] == "<p>EN</p>"
+    assert doc["paragraphs"][0]["strategies"][0]["title"] == "Strategy"
+    assert doc["strategies"][0]["title"] == "Strategy"
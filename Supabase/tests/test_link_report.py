@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import link_report  # noqa: E402
+
+NOW = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def write_report(tmp_path, generated_at, broken):
+    path = tmp_path / "link_report.json"
+    path.write_text(json.dumps({"generated_at": generated_at.isoformat(), "broken": broken}), encoding="utf-8")
+    return str(path)
+
+
+def test_only_definitive_failures_are_dropped(tmp_path):
+    path = write_report(
+        tmp_path,
+        NOW - timedelta(hours=1),
+        [{"url": "http://a.test/gone", "failure": "definitive"}, {"url": "http://a.test/busy", "failure": "transient"}],
+    )
+    broken = link_report.load_broken_urls(path, max_age_hours=24, now=NOW)
+
+    assert link_report.asset_url("http://a.test/gone", broken, "p", "thumbnail", drop_broken=True) is None
+    assert link_report.asset_url("http://a.test/busy", broken, "p", "thumbnail", drop_broken=True) == "http://a.test/busy"
+    assert link_report.asset_url("http://a.test/gone", broken, "p", "thumbnail", drop_broken=False) == "http://a.test/gone"
+    assert link_report.asset_url("http://a.test/ok", broken, "p", "thumbnail", drop_broken=True) == "http://a.test/ok"
+
+
+def test_old_report_is_downgraded_to_transient(tmp_path):
+    path = write_report(tmp_path, NOW - timedelta(hours=48), [{"url": "http://a.test/gone", "failure": "definitive"}])
+    broken = link_report.load_broken_urls(path, max_age_hours=24, now=NOW)
+
+    assert broken == {"http://a.test/gone": "transient"}
+    assert link_report.asset_url("http://a.test/gone", broken, "p", "thumbnail", drop_broken=True) == "http://a.test/gone"
+
+
+def test_missing_or_malformed_report_is_ignored(tmp_path):
+    assert link_report.load_broken_urls(str(tmp_path / "missing.json"), now=NOW) == {}
+
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text('{"generated_at": "2026-01-', encoding="utf-8")
+    assert link_report.load_broken_urls(str(truncated), now=NOW) == {}
+
+    no_date = tmp_path / "no_date.json"
+    no_date.write_text(json.dumps({"broken": [{"url": "http://a.test/gone"}]}), encoding="utf-8")
+    assert link_report.load_broken_urls(str(no_date), now=NOW) == {}
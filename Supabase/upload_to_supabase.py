@@ -4,6 +4,8 @@ from datetime import date
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from link_report import asset_url, load_broken_urls
+
 # --- CONFIGURACIÓN DE RUTAS RELATIVAS ---
 # Estamos en /Supabase, queremos ir a /Scraping/...
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Carpeta actual (Supabase)
@@ -94,6 +96,7 @@ def run_migration():
 
     status = normalize_status(DEFAULT_STATUS)
     print(f"ℹ️  Status por defecto para contenido: {status}")
+    broken_urls = load_broken_urls()
 
     # 1. CARGAR DATOS DE ESTRATEGIAS
     print("\n📂 Procesando Estrategias...")
@@ -102,13 +105,13 @@ def run_migration():
     for s in strat_base:
         slug = s["slug"]
         translations = s.get("translations", {})
-        hero_image_url = s.get("hero_image_url") or s.get("hero_image")
+        hero_image_url = asset_url(s.get("hero_image_url") or s.get("hero_image"), broken_urls, slug, "hero_image")
         res = (
             supabase.table("strategies")
             .upsert(
                 {
                     "slug": slug,
-                    "logo_url": s.get("logo_url"),
+                    "logo_url": asset_url(s.get("logo_url"), broken_urls, slug, "logo_url"),
                     "hero_image_url": hero_image_url,
                     "translations": translations,
                     "status": status,
@@ -137,6 +140,12 @@ def run_migration():
     for p in proj_base:
         slug = p["slug"]
         translations = p.get("translations", {})
+        for lang, t in translations.items():
+            if t and t.get("video_url"):
+                t["video_url"] = asset_url(t["video_url"], broken_urls, slug, f"{lang}.video_url") or ""
+        gallery_urls = [
+            u for u in (asset_url(g, broken_urls, slug, "gallery_images") for g in p.get("gallery_images", [])) if u
+        ]
 
         published_at = None
         if status == "published":
@@ -147,10 +156,10 @@ def run_migration():
             .upsert(
                 {
                     "slug": slug,
-                    "thumbnail_url": p.get("thumbnail"),
-                    "external_link_url": p.get("external_link"),
-                    "location_map_url": p.get("location_map"),
-                    "gallery_urls": p.get("gallery_images", []),
+                    "thumbnail_url": asset_url(p.get("thumbnail"), broken_urls, slug, "thumbnail"),
+                    "external_link_url": asset_url(p.get("external_link"), broken_urls, slug, "external_link"),
+                    "location_map_url": asset_url(p.get("location_map"), broken_urls, slug, "location_map"),
+                    "gallery_urls": gallery_urls,
                     "translations": translations,
                     "status": status,
                     "deleted_at": None,
@@ -199,3 +208,9 @@ def run_migration():
 
 if __name__ == "__main__":
     run_migration()
+
+    # Etapa posterior: snapshots JSON listos para renderizar (ver build_snapshots.py).
+    if os.getenv("MIGRATION_SKIP_SNAPSHOTS", "").strip().lower() not in ("1", "true", "yes"):
+        from build_snapshots import build_snapshots
+
+        build_snapshots()